@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Annotated
 from enum import Enum
+import msgspec
 from bson import ObjectId
 from pydantic import BaseModel, BeforeValidator, Field
 
@@ -100,18 +101,33 @@ class ProjectTargetUpdate(BaseModel):
     progress: Optional[int] = None
 
 
-class ProjectOut(BaseModel):
-    id: PyObjectId = Field(validation_alias="_id")
+# 읽기 전용 응답 모델 (DB 문서 -> msgspec.json.encode, pydantic 검증 없음)
+class ProjectThumbnailOut(msgspec.Struct):
+    kind: str
+    key: str | None = None
+    url: str | None = None
+
+
+class ProjectTargetOut(msgspec.Struct):
+    target_id: str
+    project_id: str
+    language_code: str
+    status: str
+    progress: int
+
+
+class ProjectOut(msgspec.Struct, kw_only=True):
+    id: str
     title: str
     status: str
     video_source: str | None = None
-    thumbnail: ProjectThumbnail | None = None
-    duration_seconds: Optional[int] | None = None
+    thumbnail: ProjectThumbnailOut | None = None
+    duration_seconds: int | None = None
     issue_count: int = 0  # 새로 집계한 값을 넣기 위한 필드
-    targets: list[ProjectTarget] = Field(default_factory=list)
-    source_language: Optional[str] = None
+    targets: list[ProjectTargetOut] = msgspec.field(default_factory=list)
+    source_language: str | None = None
     created_at: datetime
-    speaker_count: Optional[int] = None
+    speaker_count: int | None = None
 
 
 class EditorPlaybackState(BaseModel):
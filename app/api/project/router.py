@@ -1,18 +1,19 @@
+import asyncio
+import msgspec
 from bson import ObjectId
 from bson.errors import InvalidId
-from fastapi import APIRouter, HTTPException, status, Depends, Query
-from typing import List, Any, Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import Any, Optional
 from pymongo.errors import PyMongoError
 from app.api.deps import DbDep
-from .models import ProjectCreate, ProjectCreateResponse, ProjectOut
-from .service import ProjectService
+from .models import ProjectCreate, ProjectCreateResponse
+from .service import PROJECT_OUT_PROJECTION, ProjectService, _doc_to_project_out
 from ..segment.segment_service import SegmentService
 from app.api.auth.model import UserOut
 from app.api.auth.service import get_current_user_from_cookie
 from .models import (
     ProjectCreate,
     ProjectCreateResponse,
-    ProjectOut,
     EditorStateResponse,
     EditorPlaybackState,
     ProjectSegmentCreate,
@@ -25,14 +26,21 @@ from ..jobs.service import start_segments_tts_job
 # from app.api.auth.service import get_current_user_from_cookie
 
 
-def _serialize(value: Any) -> Any:
+def _enc_hook(value: Any) -> Any:
+    # msgspec이 모르는 타입 중 Mongo 문서에 남을 수 있는 ObjectId만 처리
     if isinstance(value, ObjectId):
         return str(value)
-    if isinstance(value, list):
-        return [_serialize(item) for item in value]
-    if isinstance(value, dict):
-        return {key: _serialize(item) for key, item in value.items()}
-    return value
+    raise NotImplementedError(f"Type is not JSON serializable: {type(value)}")
+
+
+_json_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+def _json_response(content: Any) -> Response:
+    """msgspec으로 직렬화한 JSON 응답 (response_model 검증/jsonable_encoder 생략)"""
+    return Response(
+        content=_json_encoder.encode(content), media_type="application/json"
+    )
 
 
 project_router = APIRouter(prefix="/projects", tags=["Projects"])
@@ -55,20 +63,16 @@ async def create_project_endpoint(
     return ProjectCreateResponse.model_validate(result)
 
 
-@project_router.get(
-    "/me",
-    response_model=List[ProjectOut],
-    summary="현재 사용자 프로젝트 목록",
-)
+@project_router.get("/me", summary="현재 사용자 프로젝트 목록")
 async def list_my_projects(
     current_user: UserOut = Depends(get_current_user_from_cookie),
     sort: Optional[str] = Query(default="created_at", description="정렬 필드"),
     page: int = Query(1, ge=1),
     limit: int = Query(6, ge=1, le=100),
     project_service: ProjectService = Depends(ProjectService),
-) -> List[ProjectOut]:
+) -> Response:
     try:
-        return await project_service.get_project_paging(
+        projects = await project_service.get_project_paging(
             sort=sort, page=page, limit=limit, user_id=str(current_user.id)
         )
     except InvalidId as exc:
@@ -81,14 +85,15 @@ async def list_my_projects(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve projects",
         ) from exc
+    return _json_response(projects)
 
 
 @project_router.get("", summary="프로젝트 전체 목록")
 async def list_projects(
     project_service: ProjectService = Depends(ProjectService),
-) -> dict:
+) -> Response:
     projects = await project_service.list_projects_with_targets()
-    return {"items": projects}
+    return _json_response({"items": projects})
 
 
 @project_router.get("/{project_id}", summary="프로젝트 상세 조회")
@@ -105,17 +110,27 @@ async def get_project(
             detail="Invalid project_id",
         ) from exc
 
-    project = await db["projects"].find_one({"_id": project_oid})
-    if not project:
+    # 프로젝트 + 타겟을 한 번의 aggregate로 조회 (project_targets.project_id 인덱스)
+    pipeline = [
+        {"$match": {"_id": project_oid}},
+        {"$project": PROJECT_OUT_PROJECTION},
+        {"$addFields": {"project_id_str": {"$toString": "$_id"}}},
+        {
+            "$lookup": {
+                "from": "project_targets",
+                "localField": "project_id_str",
+                "foreignField": "project_id",
+                "as": "targets",
+            }
+        },
+    ]
+    docs = await db["projects"].aggregate(pipeline).to_list(length=1)
+    if not docs:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-
-    project_id_str = str(project_oid)
-    project["targets"] = (
-        await db["project_targets"].find({"project_id": project_id_str}).to_list(None)
-    )
+    project = docs[0]
 
     # segments = (
     #     await db["segments"]
@@ -139,9 +154,8 @@ async def get_project(
     #     seg_id = segment["_id"]
     #     segment["issues"] = issues_by_segment.get(seg_id, [])
     # project["segments"] = segments
-    # serialized = _serialize(project)
     # return ProjectOut.model_validate(project)
-    return ProjectOut.model_validate(project)
+    return _json_response(_doc_to_project_out(project))
 
 
 @project_router.delete("/{project_id}", response_model=int, summary="프로젝트 삭제")
@@ -158,14 +172,18 @@ async def delete_project(
             detail="Invalid project_id",
         ) from exc
 
-    result = await project_service.delete_project(project_oid)
-    if result == 0:
+    # S3 삭제가 실패하면 DB 행을 남겨 두어야 객체가 고아가 되지 않으므로 먼저 실행
+    await project_service.drop_project_storage(project_oid)
+    # 프로젝트/세그먼트 삭제를 병렬로 실행 (없는 프로젝트면 세그먼트도 없어 삭제 0건)
+    deleted, result = await asyncio.gather(
+        project_service.delete_project(project_oid),
+        segment_service.delete_segments_by_project(project_oid),
+    )
+    if deleted == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-
-    result = await segment_service.delete_segments_by_project(project_oid)
     return result
 
 
@@ -176,7 +194,15 @@ async def get_project_editor(
     project_service: ProjectService = Depends(ProjectService),
     segment_service: SegmentService = Depends(SegmentService),
 ) -> EditorStateResponse:
-    project = await project_service.get_project_by_id(project_id)  # 기본 정보
+    try:
+        project_oid = ObjectId(project_id)
+    except InvalidId as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid project_id",
+        ) from exc
+
+    project = await project_service.get_project_by_id(project_oid)  # 기본 정보
     segments = await segment_service.get_project_segment_translations(
         project_id, language_code
     )
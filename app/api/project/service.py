@@ -1,21 +1,73 @@
+import asyncio
 from fastapi import HTTPException, status
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from bson import ObjectId
+from pymongo import ReturnDocument
 from ..deps import DbDep
 from .models import (
     ProjectCreate,
     ProjectUpdate,
     ProjectPublic,
-    ProjectBase,
     ProjectOut,
+    ProjectTargetOut,
     ProjectTargetStatus,
     ProjectTarget,
     ProjectTargetUpdate,
+    ProjectThumbnailOut,
 )
 from app.config.s3 import drop_projects
 from app.config.env import settings
 
+CURSOR_BATCH_SIZE = 500
+# ProjectOut에 필요한 필드만 전송 (segments 등 큰 필드 제외)
+PROJECT_OUT_PROJECTION = {
+    "title": 1,
+    "status": 1,
+    "video_source": 1,
+    "thumbnail": 1,
+    "duration_seconds": 1,
+    "source_language": 1,
+    "created_at": 1,
+    "speaker_count": 1,
+}
+
+
+def _doc_to_project_out(doc: Dict[str, Any]) -> ProjectOut:
+    """DB에서 읽은(쓰기 시 검증된) 문서를 ProjectOut으로 변환 (ObjectId -> str)"""
+    thumbnail = doc.get("thumbnail")
+    targets = [
+        ProjectTargetOut(
+            target_id=str(target["_id"]),
+            project_id=target["project_id"],
+            language_code=target["language_code"],
+            status=target["status"],
+            progress=target["progress"],
+        )
+        for target in doc.get("targets") or []
+    ]
+    return ProjectOut(
+        id=str(doc["_id"]),
+        title=doc["title"],
+        status=doc["status"],
+        video_source=doc.get("video_source"),
+        thumbnail=(
+            ProjectThumbnailOut(
+                kind=thumbnail["kind"],
+                key=thumbnail.get("key"),
+                url=thumbnail.get("url"),
+            )
+            if thumbnail
+            else None
+        ),
+        duration_seconds=doc.get("duration_seconds"),
+        issue_count=doc.get("issue_count", 0),
+        targets=targets,
+        source_language=doc.get("source_language"),
+        created_at=doc["created_at"],
+        speaker_count=doc.get("speaker_count"),
+    )
+
 
 class ProjectService:
     def __init__(self, db: DbDep):
@@ -25,9 +77,9 @@ class ProjectService:
         self.target_collection = db.get_collection("project_targets")
         self.bucket = settings.S3_BUCKET
 
-    async def get_project_by_id(self, project_id: str) -> ProjectPublic:
-        doc = await self.project_collection.find_one({"_id": ObjectId(project_id)})
-        doc["project_id"] = str(doc["_id"])
+    async def get_project_by_id(self, project_oid: ObjectId) -> ProjectPublic:
+        doc = await self.project_collection.find_one({"_id": project_oid})
+        doc["project_id"] = str(project_oid)
         return ProjectPublic.model_validate(doc)
 
     async def get_project_paging(
@@ -38,54 +90,61 @@ class ProjectService:
         limit: int = 6,
     ) -> List[ProjectOut]:
         skip = (page - 1) * limit
-        docs = (
-            await self.project_collection.find({"owner_code": user_id})
-            .sort([(sort, -1)])
+        owner_filter = {"owner_code": user_id}
+        # _id를 2차 정렬키로 두어 두 쿼리가 같은 페이지를 보도록 고정
+        docs_query = (
+            self.project_collection.find(owner_filter, PROJECT_OUT_PROJECTION)
+            .sort([(sort, -1), ("_id", -1)])
             .skip(skip)
             .limit(limit)
             .to_list(length=limit)
         )
 
-        project_ids = [doc["_id"] for doc in docs]
-
+        # project_ids를 기다리지 않고 같은 페이지 창에서 issue 수를 병렬 집계
         pipeline = [
-            {"$match": {"project_id": {"$in": project_ids}}},
+            {"$match": owner_filter},
+            {"$sort": {sort: -1, "_id": -1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": {"_id": 1}},
             {
                 "$lookup": {
-                    "from": "issues",
-                    "let": {"segmentId": "$_id"},
-                    "pipeline": [
-                        {"$match": {"$expr": {"$eq": ["$segment_id", "$$segmentId"]}}},
-                        {"$count": "count"},
-                    ],
-                    "as": "issue_docs",
-                }
-            },
-            {
-                "$addFields": {
-                    "issue_count": {"$ifNull": [{"$first": "$issue_docs.count"}, 0]}
+                    "from": "segments",
+                    "localField": "_id",
+                    "foreignField": "project_id",
+                    # 세그먼트 본문/issues 배열까지 끌어오지 않도록 _id만 가져옴 (16MB 제한)
+                    "pipeline": [{"$project": {"_id": 1}}],
+                    "as": "segments",
                 }
             },
             {
-                "$group": {
-                    "_id": "$project_id",
-                    "issue_count": {"$sum": "$issue_count"},
+                "$lookup": {
+                    "from": "issues",
+                    "localField": "segments._id",
+                    "foreignField": "segment_id",
+                    # 개수만 필요하므로 이슈 문서 전체 대신 _id만 가져옴
+                    "pipeline": [{"$project": {"_id": 1}}],
+                    "as": "issues",
                 }
             },
+            {"$project": {"issue_count": {"$size": "$issues"}}},
         ]
-        issue_counts = await self.segment_collection.aggregate(pipeline).to_list(
-            length=None
+        counts_query = self.project_collection.aggregate(pipeline).to_list(
+            length=limit
         )
+
+        docs, issue_counts = await asyncio.gather(docs_query, counts_query)
         issue_map = {row["_id"]: row["issue_count"] for row in issue_counts}
 
         result = []
         for doc in docs:
             doc["issue_count"] = issue_map.get(doc["_id"], 0)
-            result.append(ProjectOut.model_validate(doc))
+            result.append(_doc_to_project_out(doc))
         return result
 
     async def list_projects_with_targets(self) -> List[ProjectOut]:
         pipeline = [
+            {"$project": PROJECT_OUT_PROJECTION},
             {"$addFields": {"project_id_str": {"$toString": "$_id"}}},
             {"$sort": {"created_at": -1}},
             {
@@ -97,33 +156,49 @@ class ProjectService:
                 }
             },
         ]
-        docs = await self.project_collection.aggregate(pipeline).to_list(length=None)
-        for doc in docs:
-            doc["targets"] = doc.get("targets") or []
-        return [ProjectOut.model_validate(doc) for doc in docs]
+        # 전체 문서를 리스트로 모으지 않고 배치 단위로 받으며 바로 변환
+        cursor = self.project_collection.aggregate(
+            pipeline, batchSize=CURSOR_BATCH_SIZE
+        )
+        return [_doc_to_project_out(doc) async for doc in cursor]
+
+    async def drop_project_storage(self, project_oid: ObjectId) -> None:
+        # S3 정리는 블로킹 boto3 호출이므로 스레드에서 실행
+        await asyncio.to_thread(drop_projects, project_id=project_oid)
 
-    async def delete_project(self, project_id: str) -> int:
-        drop_projects(project_id=project_id)
-        result = await self.project_collection.delete_one({"_id": project_id})
+    async def delete_project(self, project_oid: ObjectId) -> int:
+        result = await self.project_collection.delete_one({"_id": project_oid})
         return result.deleted_count
 
     async def create_project(self, payload: ProjectCreate) -> str:
-        now = datetime.now()
-        base = ProjectBase(
-            owner_id=payload.owner_id,
-            title=payload.title,
-            source_type=payload.sourceType,
-            video_source=None,
-            source_language=payload.sourceLanguage,
-            status="uploading",
-            created_at=now,
-            speaker_count=payload.speakerCount,
+        # _id를 미리 만들어 두면 타겟 생성이 insert 결과를 기다릴 필요가 없음
+        project_oid = ObjectId()
+        project_id = str(project_oid)
+        # payload는 이미 검증됨: ProjectBase 생성/model_dump 없이 문서를 직접 구성
+        doc = {
+            "_id": project_oid,
+            "owner_id": payload.owner_id,
+            "title": payload.title,
+            "status": "uploading",
+            "source_type": payload.sourceType,
+            "target_languages": [],
+            "created_at": datetime.now(),
+            "speaker_count": payload.speakerCount,
+        }
+        if payload.sourceLanguage is not None:
+            doc["source_language"] = payload.sourceLanguage
+        # 프로젝트 생성 시, 타겟(타겟 언어별 진행도)을 프로젝트 insert와 병렬로 생성
+        project_result, targets_result = await asyncio.gather(
+            self.project_collection.insert_one(doc),
+            self._create_project_targets(project_id, payload.targetLanguages),
+            return_exceptions=True,
         )
-        doc = base.model_dump(exclude_none=True)
-        result = await self.project_collection.insert_one(doc)
-        # 프로젝트 생성 시, 타겟(타겟 언어별 진행도) 생성
-        project_id = str(result.inserted_id)
-        await self._create_project_targets(project_id, payload.targetLanguages)
+        if isinstance(project_result, BaseException):
+            # 프로젝트 insert가 실패하면 이미 들어간 타겟이 고아로 남지 않도록 정리
+            await self.target_collection.delete_many({"project_id": project_id})
+            raise project_result
+        if isinstance(targets_result, BaseException):
+            raise targets_result
         return {"project_id": project_id}
 
     async def update_project(self, payload: ProjectUpdate) -> ProjectPublic:
@@ -131,23 +206,18 @@ class ProjectService:
         update_data = payload.model_dump(exclude={"project_id"}, exclude_none=True)
         update_data["updated_at"] = datetime.now()
 
-        result = await self.project_collection.update_one(
+        doc = await self.project_collection.find_one_and_update(
             {"_id": ObjectId(project_id)},
             {"$set": update_data},
+            return_document=ReturnDocument.AFTER,
         )
-
-        doc = await self.project_collection.find_one({"_id": ObjectId(project_id)})
         if not doc:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        doc["project_id"] = str(doc["_id"])
-
-        if result.matched_count == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Project not found",
             )
 
+        doc["project_id"] = str(doc["_id"])
         return ProjectPublic.model_validate(doc)
 
     async def _create_project_targets(
@@ -1,4 +1,6 @@
 from datetime import datetime, timezone
+from functools import lru_cache
+import numpy as np
 from fastapi import HTTPException
 from bson import ObjectId
 from bson.errors import InvalidId
@@ -12,6 +14,38 @@ from ..project.models import (
     SegmentTranslationCreate,
 )
 
+SEGMENT_INSERT_BATCH_SIZE = 1000
+_SEGMENT_ASSET_KEYS = ("source_key", "bgm_key", "tts_key", "mix_key", "video_key")
+
+
+def _float_or_none(value: Any) -> float | None:
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _time_column(segments: list[dict[str, Any]], field: str) -> list[float]:
+    """세그먼트들의 start/end 값을 한 번에 float로 변환 (NaN/누락 -> 0.0)"""
+    try:
+        values = np.fromiter(
+            (segment.get(field) or 0.0 for segment in segments),
+            dtype=np.float64,
+            count=len(segments),
+        )
+    except (TypeError, ValueError):
+        # 숫자로 바꿀 수 없는 값이 섞여 있으면 행 단위 변환으로 대체
+        return [_float_or_none(segment.get(field)) or 0.0 for segment in segments]
+    return np.where(np.isnan(values), 0.0, values).tolist()
+
+
+@lru_cache(maxsize=4096)
+def _to_oid(value: str) -> ObjectId:
+    # ObjectId는 불변이므로 같은 문자열에 대한 파싱 결과를 공유해도 안전
+    return ObjectId(value)
+
 
 class SegmentService:
     def __init__(self, db: DbDep):
@@ -50,20 +84,28 @@ class SegmentService:
         now = datetime.now()
         docs: list[dict[str, Any]] = []
 
-        for index, raw in enumerate(segments_meta or []):
-            normalized = self._normalize_segment_for_store(raw or {}, index=index)
-            normalized.update(
-                {
-                    "project_id": project_oid,
-                    "segment_index": index,
-                    "created_at": now,
-                    "updated_at": now,
-                }
+        segments = [raw or {} for raw in segments_meta or []]
+        starts = _time_column(segments, "start")
+        ends = _time_column(segments, "end")
+
+        normalize = self._normalize_segment_for_store
+        for index, segment in enumerate(segments):
+            normalized = normalize(
+                segment, index=index, start_point=starts[index], end_point=ends[index]
             )
+            normalized["project_id"] = project_oid
+            normalized["segment_index"] = index
+            normalized["created_at"] = now
+            normalized["updated_at"] = now
             docs.append(normalized)
 
-        if docs:
-            await self.segment_collection.insert_many(docs)
+        # 서버에서 생성한 신뢰 데이터: 순서 무관 + 스키마 재검증 생략, 배치마다 루프 양보
+        for start in range(0, len(docs), SEGMENT_INSERT_BATCH_SIZE):
+            await self.segment_collection.insert_many(
+                docs[start : start + SEGMENT_INSERT_BATCH_SIZE],
+                ordered=False,
+                bypass_document_validation=True,
+            )
 
         return docs
 
@@ -100,7 +142,7 @@ class SegmentService:
 
     def _as_object_id(self, project_id: str) -> ObjectId:
         try:
-            return ObjectId(project_id)
+            return _to_oid(project_id)
         except InvalidId as exc:
             raise HTTPException(status_code=400, detail="invalid project_id") from exc
 
@@ -147,45 +189,39 @@ class SegmentService:
         segment: dict[str, Any],
         *,
         index: int,
+        start_point: float,
+        end_point: float,
     ) -> dict[str, Any]:
-        def _float_or_none(value: Any) -> float | None:
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                return None
-
-        segment_id = segment.get("seg_id")
+        seg_get = segment.get
         try:
-            segment_oid = ObjectId(segment_id)
+            segment_oid = ObjectId(seg_get("seg_id"))
         except (InvalidId, TypeError):
             segment_oid = ObjectId()
 
-        issues = segment.get("issues") or []
+        issues = seg_get("issues") or []
         if not isinstance(issues, list):
             issues = [issues]
 
         normalized: dict[str, Any] = {
             "segment_id": segment_oid,
-            "segment_text": segment.get("seg_txt", ""),
-            "translate_context": segment.get("trans_txt", ""),
-            "score": segment.get("score"),
-            "editor_id": segment.get("editor_id"),
-            "start_point": _float_or_none(segment.get("start")) or 0.0,
-            "end_point": _float_or_none(segment.get("end")) or 0.0,
+            "segment_text": seg_get("seg_txt", ""),
+            "translate_context": seg_get("trans_txt", ""),
+            "score": seg_get("score"),
+            "editor_id": seg_get("editor_id"),
+            "start_point": start_point,
+            "end_point": end_point,
             "issues": issues,
-            "sub_langth": _float_or_none(segment.get("sub_langth")),
+            "sub_langth": _float_or_none(seg_get("sub_langth")),
             # "order": segment.get("order", index),
         }
 
-        assets = segment.get("assets")
+        assets = seg_get("assets")
         if isinstance(assets, dict):
             normalized["assets"] = assets
 
-        for key in ("source_key", "bgm_key", "tts_key", "mix_key", "video_key"):
-            value = segment.get(key)
-            if value:
-                normalized[key] = value
-
+        normalized.update(
+            {key: value for key in _SEGMENT_ASSET_KEYS if (value := seg_get(key))}
+        )
         return normalized
 
     async def get_project_segment_translations(
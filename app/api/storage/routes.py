@@ -1,15 +1,16 @@
 # app/api/routes/upload.py
-import os
 import asyncio
 import logging
 import tempfile
+import threading
 import logging
 from uuid import uuid4
 from hashlib import sha256
+from cachetools import TTLCache
 from sse_starlette.sse import EventSourceResponse
 
 from fastapi import APIRouter, HTTPException, Request, status, Depends
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse
 from redis.exceptions import RedisError
 from rq import Queue
 from pymongo.errors import PyMongoError
@@ -17,12 +18,12 @@ from botocore.exceptions import ClientError
 
 from app.api.jobs.service import start_job, start_jobs_for_targets
 from app.api.project.service import ProjectService
-from app.config.s3 import s3
+from app.config.s3 import AWS_S3_BUCKET, s3
 from app.utils.job_utils import process_project_jobs
 from ..deps import DbDep
 from bson.errors import InvalidId
 from ..project.models import ProjectUpdate
-from ..pipeline.service import update_pipeline_stage, get_pipeline_status
+from ..pipeline.service import update_pipeline_stage
 from ..pipeline.models import PipelineUpdate, PipelineStatus
 from .models import PresignRequest, UploadFinalize
 from app.api.auth.service import get_current_user_from_cookie
@@ -41,19 +42,13 @@ logger = logging.getLogger("api_logger")
 
 
 def _make_idem_key(req: RegisterRequest, header_key: str | None) -> str:
-    return (
-        header_key
-        or sha256(f"{req.project_id}|{str(req.youtube_url)}".encode()).hexdigest()
-    )
+    if header_key:
+        return header_key
+    return sha256(f"{req.project_id}|{req.youtube_url}".encode()).hexdigest()
 
 
 r = get_redis()
 UPLOAD_QUEUE = Queue("uploads", connection=r)
-IDEMPOTENCY_HEADER_CANDIDATES = (
-    "Idempotency-Key",
-    "X-Idempotency-Key",
-    "Dupilot-Idempotency-Key",
-)
 
 
 @upload_router.post(
@@ -63,12 +58,12 @@ IDEMPOTENCY_HEADER_CANDIDATES = (
 )
 async def register_source(payload: RegisterRequest, request: Request, db: DbDep):
     # 1) 멱등키 확보
-    header_key = None
-    for header_name in IDEMPOTENCY_HEADER_CANDIDATES:
-        value = request.headers.get(header_name)
-        if value:
-            header_key = value
-            break
+    # 헤더 이름은 소문자로 저장되므로 소문자 키로 바로 조회 (대부분 첫 번째에서 종료)
+    header_key = (
+        request.headers.get("idempotency-key")
+        or request.headers.get("x-idempotency-key")
+        or request.headers.get("dupilot-idempotency-key")
+    )
     job_id = _make_idem_key(payload, header_key)
 
     # 2) 기존 jobId가 있으면 그대로 반환
@@ -128,7 +123,7 @@ async def prepare_file_upload(
     # _current_user: UserOut = Depends(get_current_user_from_cookie),  # 인증 추가
     project_service: ProjectService = Depends(ProjectService),
 ):
-    bucket = os.getenv("AWS_S3_BUCKET")
+    bucket = AWS_S3_BUCKET
     if not bucket:
         raise HTTPException(status_code=500, detail="AWS_S3_BUCKET env not set")
 
@@ -140,7 +135,8 @@ async def prepare_file_upload(
         f"projects/{payload.project_id}/inputs/videos/{uuid4()}_{payload.filename}"
     )
     try:
-        presigned = s3.generate_presigned_post(
+        presigned = await asyncio.to_thread(
+            s3.generate_presigned_post,
             Bucket=bucket,
             Key=object_key,
             Fields={"Content-Type": payload.content_type},
@@ -160,32 +156,22 @@ async def prepare_file_upload(
     }
 
 
-@upload_router.post("/finish-upload", status_code=status.HTTP_202_ACCEPTED)
-async def finish_upload(
-    db: DbDep,
-    payload: UploadFinalize,
-    # _current_user: UserOut = Depends(get_current_user_from_cookie),  # 인증 추가
-    project_service: ProjectService = Depends(ProjectService),
-):
-    bucket = os.getenv("AWS_S3_BUCKET")
-    if not bucket:
-        raise HTTPException(status_code=500, detail="AWS_S3_BUCKET env not set")
-
+def _extract_video_assets(
+    bucket: str, object_key: str, project_id: str
+) -> tuple[ProjectThumbnail | None, int | None]:
     thumbnail_payload: ProjectThumbnail | None = None
-    suffix = Path(payload.object_key).suffix or ".mp4"
+    suffix = Path(object_key).suffix or ".mp4"
     duration_seconds = None
     with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
         tmp_path = Path(tmp_file.name)
     try:
         try:
-            s3.download_file(bucket, payload.object_key, str(tmp_path))
+            s3.download_file(bucket, object_key, str(tmp_path))
         except ClientError:
             thumbnail_payload = None
         else:
             try:
-                thumbnail_key = extract_and_upload_thumbnail(
-                    tmp_path, payload.project_id
-                )
+                thumbnail_key = extract_and_upload_thumbnail(tmp_path, project_id)
                 thumbnail_payload = ProjectThumbnail(
                     kind="s3", key=thumbnail_key, url=None
                 )
@@ -199,6 +185,24 @@ async def finish_upload(
             tmp_path.unlink(missing_ok=True)
         except OSError:
             pass
+    return thumbnail_payload, duration_seconds
+
+
+@upload_router.post("/finish-upload", status_code=status.HTTP_202_ACCEPTED)
+async def finish_upload(
+    db: DbDep,
+    payload: UploadFinalize,
+    # _current_user: UserOut = Depends(get_current_user_from_cookie),  # 인증 추가
+    project_service: ProjectService = Depends(ProjectService),
+):
+    bucket = AWS_S3_BUCKET
+    if not bucket:
+        raise HTTPException(status_code=500, detail="AWS_S3_BUCKET env not set")
+
+    # S3 다운로드/썸네일 추출(ffmpeg)은 블로킹이므로 스레드에서 실행
+    thumbnail_payload, duration_seconds = await asyncio.to_thread(
+        _extract_video_assets, bucket, payload.object_key, payload.project_id
+    )
 
     update_payload = ProjectUpdate(
         project_id=payload.project_id,
@@ -208,7 +212,6 @@ async def finish_upload(
         duration_seconds=duration_seconds,
     )
     try:
-        get_pipeline_status(db, update_payload.project_id)
         result = await project_service.update_project(update_payload)
     except InvalidId as exc:
         raise HTTPException(
@@ -235,19 +238,40 @@ async def finish_upload(
     return result
 
 
-@upload_router.get("/media/{key:path}")
-def media_redirect(key: str):
-    bucket = os.getenv("AWS_S3_BUCKET")
+PRESIGNED_URL_EXPIRES_IN = 3600
+# URL 만료(1시간)보다 충분히 짧게 캐시해 재사용된 URL도 최소 55분은 유효
+PRESIGNED_URL_CACHE_TTL = 300
+_presigned_url_cache: TTLCache = TTLCache(maxsize=4096, ttl=PRESIGNED_URL_CACHE_TTL)
+_presigned_url_lock = threading.Lock()
+
+
+def _presigned_get_url(bucket: str, key: str) -> str:
+    cache_key = (bucket, key)
+    with _presigned_url_lock:
+        url = _presigned_url_cache.get(cache_key)
+    if url is None:
+        url = s3.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=PRESIGNED_URL_EXPIRES_IN,
+        )
+        with _presigned_url_lock:
+            _presigned_url_cache[cache_key] = url
+    return url
+
+
+# 의존성/검증이 없는 고빈도 엔드포인트라 APIRoute 대신 app에 Starlette Route로 등록
+# (app/main.py, 동기 함수이므로 Starlette가 스레드풀에서 실행)
+def media_redirect(request: Request) -> JSONResponse:
+    bucket = AWS_S3_BUCKET
     if not bucket:
         raise HTTPException(status_code=500, detail="AWS_S3_BUCKET env not set")
 
-    url = s3.generate_presigned_url(
-        "get_object", Params={"Bucket": bucket, "Key": key}, ExpiresIn=3600
-    )
+    url = _presigned_get_url(bucket, request.path_params["key"])
 
     # resp = RedirectResponse(url, status_code=302)
     # resp.headers["Cache-Control"] = "private, max-age=300"
-    return {"url": url}
+    return JSONResponse({"url": url})
 
 
 @upload_router.get("/{project_id}/events")
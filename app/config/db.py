@@ -41,5 +41,18 @@ async def ensure_db_connection() -> None:
         raise
 
 
+async def ensure_indexes() -> None:
+    # get_project_paging: owner_code 필터 + (created_at, _id) 정렬을 인덱스로 처리
+    await database["projects"].create_index(
+        [("owner_code", 1), ("created_at", -1), ("_id", -1)]
+    )
+    await database["segments"].create_index([("project_id", 1), ("segment_index", 1)])
+    await database["project_segments"].create_index(
+        [("project_id", 1), ("segment_index", 1)]
+    )
+    await database["project_targets"].create_index("project_id")
+    await database["issues"].create_index("segment_id")
+
+
 async def get_db() -> AsyncGenerator[AsyncIOMotorDatabase, None]:
     yield database
@@ -34,6 +34,16 @@ class Settings(BaseSettings):
     S3_BUCKET: str = os.getenv("AWS_S3_BUCKET", "dupilot-dev-media")
     AWS_REGION: str = os.getenv("AWS_REGION", "ap-northeast-2")
     INGEST_WORKDIR: str = os.getenv("INGEST_WORKDIR", "/tmp/dupilot-ingest")
+    # RAM 기반 임시 디렉터리, 여유 공간이 INGEST_TMPFS_MIN_FREE_BYTES 이상일 때만 사용
+    INGEST_TMPFS_DIR: str = os.getenv("INGEST_TMPFS_DIR", "/dev/shm/dupilot-ingest")
+    INGEST_TMPFS_MIN_FREE_BYTES: int = int(
+        os.getenv("INGEST_TMPFS_MIN_FREE_BYTES", str(4 * 1024 * 1024 * 1024))
+    )
+    # 워커 비정상 종료로 남은 임시 디렉터리 정리 기준/주기
+    INGEST_TMP_TTL_SECONDS: int = int(os.getenv("INGEST_TMP_TTL_SECONDS", "7200"))
+    INGEST_SWEEP_INTERVAL_SECONDS: int = int(
+        os.getenv("INGEST_SWEEP_INTERVAL_SECONDS", "1800")
+    )
 
 
 settings = Settings()
@@ -1,7 +1,7 @@
 from fastapi import FastAPI
 import logging
 from contextlib import asynccontextmanager
-from app.config.db import ensure_db_connection
+from app.config.db import ensure_db_connection, ensure_indexes
 
 # from app.api.translate.service import vector_search
 
@@ -11,5 +11,6 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await ensure_db_connection()
+    await ensure_indexes()
     # Glossary warmup disabled
     yield
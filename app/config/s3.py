@@ -1,4 +1,5 @@
 import os, boto3
+from botocore.config import Config
 from dotenv import load_dotenv
 from .env import settings
 
@@ -7,13 +8,42 @@ load_dotenv()
 
 aws_profile = os.getenv("AWS_PROFILE")
 aws_region = os.getenv("AWS_REGION", "ap-northeast-2")
+AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET")
 
 session_kwargs = {}
 if aws_profile:
     session_kwargs["profile_name"] = aws_profile
 
+# Transfer Acceleration은 버킷에 활성화되어 있어야 하므로 환경변수로 켬
+AWS_S3_USE_ACCELERATE = os.getenv("AWS_S3_USE_ACCELERATE", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
 session = boto3.Session(**session_kwargs, region_name=aws_region)
-s3 = session.client("s3")
+# 프로세스 전역 클라이언트: 커넥션 풀/서명 상태를 요청 간에 재사용
+s3 = session.client(
+    "s3",
+    config=Config(
+        max_pool_connections=64,
+        signature_version="s3v4",
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 5},
+        s3={
+            "use_accelerate_endpoint": AWS_S3_USE_ACCELERATE,
+            "addressing_style": "virtual",
+        },
+    ),
+)
+
+
+def _reset_s3_pool_after_fork() -> None:
+    # 부모가 연 소켓/TLS 세션을 자식이 공유하지 않도록 풀만 비움 (다음 요청에서 새로 연결)
+    s3._endpoint.http_session.close()
+
+
+os.register_at_fork(after_in_child=_reset_s3_pool_after_fork)
 
 
 def drop_projects(project_id):
@@ -5,6 +5,7 @@ from app.config.env import origins as allowed_origins
 from app.api.deps import DbDep
 from app.config.lifespan import lifespan
 from app.api.main import api_router
+from app.api.storage.routes import media_redirect
 
 app = FastAPI(
     title="Dupilot",
@@ -23,6 +24,13 @@ app.add_middleware(
 
 app.add_middleware(LoggingMiddleware)
 
+# /api/storage/{project_id}/events 보다 먼저 매칭되도록 api_router 앞에 등록
+app.add_route(
+    "/api/storage/media/{key:path}",
+    media_redirect,
+    methods=["GET"],
+    include_in_schema=False,
+)
 app.include_router(api_router)
 
 
@@ -16,7 +16,8 @@ async def process_project_jobs(
     start_job,
     start_jobs_for_targets,
     db,
-    context: str = "process"
+    context: str = "process",
+    targets: Optional[list] = None,
 ) -> None:
     """
     프로젝트의 타겟 언어에 따라 job을 생성하는 공통 로직
@@ -29,9 +30,11 @@ async def process_project_jobs(
         start_jobs_for_targets: 다중 job 생성 함수
         db: 데이터베이스 연결
         context: 호출 컨텍스트 (로깅용)
+        targets: 이미 조회한 타겟 목록 (없으면 여기서 조회)
     """
     # 프로젝트의 타겟 언어들 가져오기
-    targets = await project_service.get_targets_by_project(project_id)
+    if targets is None:
+        targets = await project_service.get_targets_by_project(project_id)
 
     if targets:
         # 유틸 함수로 언어 코드 추출
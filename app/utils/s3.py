@@ -1,4 +1,3 @@
-from pathlib import Path
 from uuid import uuid4
 import json
 import asyncio
@@ -11,10 +10,9 @@ logger = logging.getLogger(__name__)
 AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET", "dupilot-dev-media")
 
 
-def build_object_key(project_id: str, file_path: Path) -> str:
-    extension = file_path.suffix or ".mp4"
-    filename = f"{uuid4()}{extension}"
-    return f"projects/{project_id}/inputs/videos/{filename}"
+def build_object_key(project_id: str, file_path: str | os.PathLike) -> str:
+    extension = os.path.splitext(os.fspath(file_path))[1] or ".mp4"
+    return f"projects/{project_id}/inputs/videos/{uuid4()}{extension}"
 
 
 async def download_metadata_from_s3(metadata_key: str) -> dict:
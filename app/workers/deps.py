@@ -0,0 +1,30 @@
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from app.api.project.service import ProjectService
+from app.config.db import make_db
+
+# 워커 프로세스 전체에서 공유하는 Mongo 클라이언트 (API와 분리), 처음 쓰일 때 생성
+_worker_db: AsyncIOMotorDatabase | None = None
+_worker_project_service: ProjectService | None = None
+
+
+def get_worker_db() -> AsyncIOMotorDatabase:
+    global _worker_db
+    if _worker_db is None:
+        _worker_db = make_db()
+    return _worker_db
+
+
+def get_worker_project_service() -> ProjectService:
+    global _worker_project_service
+    if _worker_project_service is None:
+        _worker_project_service = ProjectService(get_worker_db())
+    return _worker_project_service
+
+
+def close_worker_db() -> None:
+    global _worker_db, _worker_project_service
+    if _worker_db is not None:
+        _worker_db.client.close()
+    _worker_db = None
+    _worker_project_service = None
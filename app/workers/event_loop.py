@@ -0,0 +1,41 @@
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+# 워커 프로세스당 하나의 이벤트 루프를 유지해 Mongo 커넥션 풀 등을 잡 간에 재사용
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_pid: int | None = None
+_loop_lock = threading.Lock()
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """백그라운드 스레드에서 도는 워커 전용 루프를 반환 (없으면 생성)
+
+    fork된 자식 프로세스에는 루프 스레드가 따라오지 않으므로 pid가 바뀌면 새로 만든다.
+    """
+    global _loop, _loop_pid
+    pid = os.getpid()
+    if _loop is not None and _loop_pid == pid:
+        return _loop
+    with _loop_lock:
+        if _loop is None or _loop_pid != pid:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="worker-event-loop", daemon=True
+            ).start()
+            _loop, _loop_pid = loop, pid
+    return _loop
+
+
+def run_in_worker_loop(coro: Coroutine[Any, Any, T]) -> T:
+    future = asyncio.run_coroutine_threadsafe(coro, get_worker_loop())
+    try:
+        return future.result()
+    except BaseException:
+        # RQ 잡 타임아웃(SIGALRM)은 이 스레드의 result()만 깨우므로 루프의 코루틴도 취소
+        # (to_thread로 넘긴 작업은 취소되지 않으니 호출 측에서 별도로 멈춰야 함)
+        future.cancel()
+        raise
@@ -1,12 +1,16 @@
 import os
 import asyncio
+import shutil
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Callable, Mapping
 
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import HTTPException, status
 from rq import get_current_job
+from rq.job import Job
 from yt_dlp import YoutubeDL
 
 from app.config.env import settings
@@ -15,7 +19,13 @@ from app.utils.s3 import build_object_key
 from app.utils.thumbnail import extract_and_upload_thumbnail, ThumbnailError
 from app.api.project.models import ProjectThumbnail
 
+from app.workers.event_loop import run_in_worker_loop
 from app.workers.jobs.video_ingest_finalizer import finalize_ingest
+from app.workers.jobs.video_ingest_stream import (
+    TailMultipartUploader,
+    can_stream_to_s3,
+    stream_to_s3,
+)
 from app.workers.jobs.video_ingest_progress import (
     DOWNLOAD_PROGRESS_PARTS,
     FINALIZE_PROGRESS_DONE,
@@ -25,23 +35,46 @@ from app.workers.jobs.video_ingest_progress import (
     emit_progress,
     make_progress_payload,
     map_download_progress,
+    map_stream_progress,
+    map_upload_progress,
     download_progress_for_completed_parts,
-    update_job_stage,
+    update_stage_and_emit,
 )
 
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 8MB 이상은 16MB 파트로 나눠 8개 스레드가 병렬 업로드 (그 미만은 단일 PUT)
+UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+
+class IngestCancelled(Exception):
+    """잡이 타임아웃 등으로 중단되어 스레드 작업을 멈춰야 할 때 콜백에서 발생"""
+
 
 async def _download_youtube_video(
     url: str,
     temp_dir: str,
     *,
     progress_hook: Callable[[dict[str, Any]], None] | None = None,
-) -> tuple[Path, dict[str, Any] | None]:
-    def _download() -> Path:
+    stream_upload: Callable[[dict[str, Any], str], None] | None = None,
+    tail_uploader: TailMultipartUploader | None = None,
+) -> tuple[str, dict[str, Any] | None, bool]:
+    """영상을 temp_dir에 내려받는다.
+
+    stream_upload가 주어지고 선택된 포맷이 단일 http 파일이면 로컬에 쓰지 않고
+    stream_upload(info, filename)로 바로 S3에 올린다. 반환값의 마지막 항목이
+    True면 스트리밍으로 처리되어 로컬 파일이 없다.
+    파일로 받는 단일 스트림은 tail_uploader가 다운로드 중에 앞부분부터 업로드한다.
+    """
+
+    def _download() -> tuple[str, dict[str, Any] | None, bool]:
         import random
         import time
 
@@ -57,7 +90,10 @@ async def _download_youtube_video(
         ydl_opts = {
             "outtmpl": os.path.join(temp_dir, "%(id)s.%(ext)s"),
             # 낮은 화질도 허용하여 다운로드 성공률 높이기 
-            "format": "best",
+            # 이미 muxed된 단일 http mp4를 우선해 ffmpeg 병합 없이 스트리밍 업로드 경로를 탐
+            # (단일 포맷이 전혀 없을 때만 video+audio 병합으로 대체)
+            "format": "best[ext=mp4][protocol^=http]/best[ext=mp4]/best/bestvideo+bestaudio",
+            # 병합 fallback일 때만 적용됨
             "merge_output_format": "mp4",
             # Bot detection 회피를 위한 옵션들
             "quiet": True,
@@ -124,13 +160,55 @@ async def _download_youtube_video(
         time.sleep(random.uniform(1, 3))
 
         with YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=True)
-            return Path(ydl.prepare_filename(info)), info
+            info = ydl.extract_info(url, download=False)
+            filename = ydl.prepare_filename(info)
+            if stream_upload and can_stream_to_s3(info):
+                try:
+                    stream_upload(info, filename)
+                    return filename, info, True
+                except IngestCancelled:
+                    raise
+                except Exception:
+                    # 스트리밍은 최적화일 뿐이므로 실패(403, 짧은 응답 등)하면 파일 다운로드로 재시도
+                    logger.warning(
+                        "stream upload failed for %s, falling back to file download",
+                        url,
+                        exc_info=True,
+                    )
+            # 병합이 필요한 포맷 등은 기존처럼 파일로 다운로드 (추출 결과 재사용)
+            if tail_uploader and not info.get("requested_formats"):
+                ydl.add_progress_hook(tail_uploader.on_progress)
+            info = ydl.process_ie_result(info, download=True)
+            return ydl.prepare_filename(info), info, False
 
     return await asyncio.to_thread(_download)
 
 
-async def _run_ingest_async(payload: Mapping[str, Any]) -> str:
+def _select_ingest_root() -> Path:
+    """tmpfs에 여유가 있으면 그쪽을, 아니면 INGEST_WORKDIR를 임시 작업 경로로 사용
+
+    다운로드와 ffmpeg 병합 쓰기가 디스크를 거치지 않도록 RAM 기반 경로를 우선한다.
+    """
+    tmpfs_root = Path(settings.INGEST_TMPFS_DIR) if settings.INGEST_TMPFS_DIR else None
+    if tmpfs_root and tmpfs_root.parent.is_dir():
+        try:
+            tmpfs_root.mkdir(exist_ok=True)
+            if shutil.disk_usage(tmpfs_root).free >= settings.INGEST_TMPFS_MIN_FREE_BYTES:
+                return tmpfs_root
+        except OSError:
+            logger.warning("tmpfs ingest dir unavailable: %s", tmpfs_root)
+
+    ingest_root = Path(settings.INGEST_WORKDIR)
+    ingest_root.mkdir(parents=True, exist_ok=True)
+    return ingest_root
+
+
+async def _run_ingest_async(
+    payload: Mapping[str, Any],
+    *,
+    job: Job | None = None,
+    cancel_event: threading.Event | None = None,
+) -> str:
     source_url = payload.get("source_url")
     project_id = payload.get("project_id")
 
@@ -144,33 +222,42 @@ async def _run_ingest_async(payload: Mapping[str, Any]) -> str:
     if not bucket:
         raise HTTPException(status_code=500, detail="AWS_S3_BUCKET env not set")
 
-    job = get_current_job()
     job_id = job.id if job else None
-    update_job_stage(job, "downloading", progress=0)
-    emit_progress(
+    if cancel_event is None:
+        cancel_event = threading.Event()
+
+    # 스레드에서 도는 다운로드/업로드는 취소되지 않으므로 진행률 콜백마다 확인해 중단
+    def _raise_if_cancelled() -> None:
+        if cancel_event.is_set():
+            raise IngestCancelled(f"ingest cancelled for project {project_id}")
+
+    logger.debug("run source=%s project=%s job=%s", source_url, project_id, job_id)
+    update_stage_and_emit(
+        job,
         project_id,
-        {
-            "job_id": job_id,
-            "stage": "downloading",
-            "status": "다운로드 시작",
-            "progress": 5,  # 초기 진행률 설정
-        },
+        "downloading",
+        status="다운로드 시작",
+        progress=5,  # 초기 진행률 설정
+        job_progress=0,
     )
 
     last_download_progress = -1
     completed_parts = 0
+    # yt_dlp 상태 파싱용 dict는 틱마다 재사용 (전송용 payload는 코얼레서가 flush 전까지
+    # 참조하므로 실제로 보낼 때만 새로 만든다)
+    tick: dict[str, Any] = {}
 
     def _progress_hook(status: dict[str, Any]) -> None:
         nonlocal last_download_progress, completed_parts
-        progress_payload = make_progress_payload(status)
-        if progress_payload is None:
+        _raise_if_cancelled()
+        if make_progress_payload(status, tick) is None:
             return
         status_name = status.get("status")
         if status_name == "finished":
             completed_parts = min(completed_parts + 1, DOWNLOAD_PROGRESS_PARTS)
             mapped_progress = download_progress_for_completed_parts(completed_parts)
         else:
-            raw_progress = progress_payload.get("progress")
+            raw_progress = tick.get("progress")
             mapped_progress = map_download_progress(
                 raw_progress, completed_parts=completed_parts
             )
@@ -179,51 +266,148 @@ async def _run_ingest_async(payload: Mapping[str, Any]) -> str:
         if mapped_progress == last_download_progress:
             return
         last_download_progress = mapped_progress
-        progress_payload["progress"] = mapped_progress
-        progress_payload.update({"job_id": job_id, "stage": "downloading"})
-        emit_progress(project_id, progress_payload)
+        progress_payload = {
+            "job_id": job_id,
+            "stage": "downloading",
+            "status": tick["status"],
+            "progress": mapped_progress,
+        }
+        if "eta" in tick:
+            progress_payload["eta"] = tick["eta"]
+        # yt_dlp 파트 완료(finished) 틱은 합치지 않고 바로 보냄
+        emit_progress(
+            project_id,
+            progress_payload,
+            coalesce=tick["status"] == "downloading",
+        )
 
     # 1) yt 다운로드 + s3 업로드
-    ingest_root = Path(settings.INGEST_WORKDIR)
-    ingest_root.mkdir(parents=True, exist_ok=True)
+    ingest_root = _select_ingest_root()
 
     thumbnail_payload: ProjectThumbnail | None = None
     metadata: dict[str, Any] | None = None
     duration_seconds: int | None = None
 
+    object_key: str | None = None
+
+    def _stream_progress(done_bytes: int, total_bytes: int) -> None:
+        nonlocal last_download_progress
+        _raise_if_cancelled()
+        mapped_progress = map_stream_progress(done_bytes, total_bytes)
+        if mapped_progress == last_download_progress:
+            return
+        last_download_progress = mapped_progress
+        emit_progress(
+            project_id,
+            {
+                "job_id": job_id,
+                "stage": "downloading",
+                "status": "downloading",
+                "progress": mapped_progress,
+            },
+            coalesce=True,
+        )
+
+    # 단일 http 포맷이면 로컬 파일 없이 다운로드와 S3 업로드를 파트 단위로 겹쳐 진행
+    def _stream_upload(info: dict[str, Any], filename: str) -> None:
+        nonlocal object_key
+        _raise_if_cancelled()
+        object_key = build_object_key(project_id, filename)
+        # 실패 시 _download_youtube_video가 파일 다운로드로 대체하므로 여기서 변환하지 않음
+        stream_to_s3(
+            info,
+            bucket=bucket,
+            object_key=object_key,
+            proxy=os.getenv("YOUTUBE_PROXY"),
+            progress_callback=_stream_progress,
+        )
+
+    tail_uploader = TailMultipartUploader(
+        bucket=bucket,
+        object_key_for=lambda path: build_object_key(project_id, path),
+    )
+
     with tempfile.TemporaryDirectory(dir=str(ingest_root)) as temp_dir:
         try:
-            local_file, metadata = await _download_youtube_video(
-                source_url, temp_dir, progress_hook=_progress_hook
+            local_file, metadata, streamed = await _download_youtube_video(
+                source_url,
+                temp_dir,
+                progress_hook=_progress_hook,
+                stream_upload=_stream_upload,
+                tail_uploader=tail_uploader,
             )
         except HTTPException:
+            await asyncio.to_thread(tail_uploader.abort)
             raise
         except Exception as exc:
+            await asyncio.to_thread(tail_uploader.abort)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="유튜브 영상을 다운로드할 수 없습니다.",
             ) from exc
+        except BaseException:
+            # 잡 타임아웃으로 취소됨: 파트 업로드 대기가 루프를 막지 않도록 스레드에서 abort
+            await asyncio.to_thread(tail_uploader.abort)
+            raise
 
-        object_key = build_object_key(project_id, local_file)
+        if not streamed:
+            update_stage_and_emit(
+                job,
+                project_id,
+                "uploading",
+                status="업로드 시작",
+                progress=UPLOAD_PROGRESS_START,
+            )
 
-        update_job_stage(job, "uploading", progress=UPLOAD_PROGRESS_START)
-        emit_progress(
-            project_id,
-            {
-                "job_id": job_id,
-                "stage": "uploading",
-                "status": "업로드 시작",
-                "progress": UPLOAD_PROGRESS_START,
-            },
-        )
-
-        try:
-            s3.upload_file(str(local_file), bucket, object_key)
-        except (BotoCoreError, ClientError) as exc:
-            raise HTTPException(
-                status_code=status.HTTP_502_BAD_GATEWAY,
-                detail="S3 업로드 중 오류가 발생했습니다.",
-            ) from exc
+            # 다운로드 중 앞부분을 이미 올렸으면 꼬리만 올리고 완료
+            if await asyncio.to_thread(tail_uploader.finish, local_file):
+                object_key = tail_uploader.object_key
+            else:
+                object_key = build_object_key(project_id, local_file)
+
+                total_bytes = os.path.getsize(local_file)
+                uploaded_bytes = 0
+                last_upload_progress = UPLOAD_PROGRESS_START
+                upload_lock = threading.Lock()
+
+                # s3transfer 워커 스레드에서 파트별 전송 바이트와 함께 호출됨
+                def _upload_progress(bytes_amount: int) -> None:
+                    nonlocal uploaded_bytes, last_upload_progress
+                    _raise_if_cancelled()
+                    with upload_lock:
+                        uploaded_bytes += bytes_amount
+                        mapped_progress = map_upload_progress(
+                            uploaded_bytes, total_bytes
+                        )
+                        if mapped_progress <= last_upload_progress:
+                            return
+                        last_upload_progress = mapped_progress
+                    emit_progress(
+                        project_id,
+                        {
+                            "job_id": job_id,
+                            "stage": "uploading",
+                            "status": "업로드 중",
+                            "progress": mapped_progress,
+                        },
+                        coalesce=True,
+                    )
+
+                try:
+                    # boto3 호출은 블로킹이므로 워커 루프를 막지 않도록 스레드에서 실행
+                    await asyncio.to_thread(
+                        s3.upload_file,
+                        local_file,
+                        bucket,
+                        object_key,
+                        Config=UPLOAD_TRANSFER_CONFIG,
+                        Callback=_upload_progress,
+                    )
+                except (BotoCoreError, ClientError) as exc:
+                    raise HTTPException(
+                        status_code=status.HTTP_502_BAD_GATEWAY,
+                        detail="S3 업로드 중 오류가 발생했습니다.",
+                    ) from exc
 
         thumbnail_payload = None
         if metadata and metadata.get("thumbnail"):
@@ -234,7 +418,9 @@ async def _run_ingest_async(payload: Mapping[str, Any]) -> str:
             )
         else:
             try:
-                thumbnail_key = extract_and_upload_thumbnail(local_file, project_id)
+                thumbnail_key = await asyncio.to_thread(
+                    extract_and_upload_thumbnail, local_file, project_id
+                )
                 thumbnail_payload = ProjectThumbnail(
                     kind="s3", key=thumbnail_key, url=None
                 )
@@ -257,32 +443,45 @@ async def _run_ingest_async(payload: Mapping[str, Any]) -> str:
         },
     )
 
-    update_job_stage(job, "finalizing", progress=FINALIZE_PROGRESS_START)
-    emit_progress(
+    update_stage_and_emit(
+        job,
         project_id,
-        {
-            "job_id": job_id,
-            "stage": "finalizing",
-            "status": "최종 처리 시작",
-            "progress": FINALIZE_PROGRESS_START,
-        },
+        "finalizing",
+        status="최종 처리 시작",
+        progress=FINALIZE_PROGRESS_START,
     )
 
     await finalize_ingest(project_id, object_key, thumbnail_payload, duration_seconds)
 
-    update_job_stage(job, "done", s3_key=object_key, progress=FINALIZE_PROGRESS_DONE)
-    emit_progress(
+    update_stage_and_emit(
+        job,
         project_id,
-        {
-            "job_id": job_id,
-            "stage": "done",
-            "status": "최종 처리 완료",
-            "s3_key": object_key,
-            "progress": FINALIZE_PROGRESS_DONE,
-        },
+        "done",
+        status="최종 처리 완료",
+        progress=FINALIZE_PROGRESS_DONE,
+        force=True,
+        s3_key=object_key,
     )
     return object_key
 
 
 def run_ingest(payload: Mapping[str, Any]) -> str:  # ← RQ가 호출하는 동기 함수
-    return asyncio.run(_run_ingest_async(payload))
+    """워커 루프에서 ingest를 실행하고 끝날 때까지 기다린다.
+
+    잡 타임아웃 등으로 중단되면 코루틴을 취소하고 cancel_event를 세워, 스레드에서 도는
+    yt_dlp 다운로드/S3 업로드가 다음 진행률 콜백에서 멈추게 한다. 콜백 사이의 단일
+    네트워크 요청(소켓 타임아웃 30초 이내)과 ffmpeg 썸네일 추출은 끝날 때까지 진행된다.
+    """
+    # get_current_job()은 RQ 스레드의 thread-local이라 루프 스레드에서는 None이 됨
+    job = get_current_job()
+    cancel_event = threading.Event()
+    try:
+        return run_in_worker_loop(
+            _run_ingest_async(payload, job=job, cancel_event=cancel_event)
+        )
+    except BaseException:
+        cancel_event.set()
+        raise
+
+
+__all__ = ["run_ingest"]
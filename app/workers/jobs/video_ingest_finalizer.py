@@ -1,18 +1,12 @@
+import asyncio
 import logging
 from app.api.jobs.service import start_job, start_jobs_for_targets
-from app.api.pipeline.models import PipelineStatus, PipelineUpdate
-from app.api.pipeline.service import update_pipeline_stage
 from app.api.project.models import ProjectUpdate, ProjectThumbnail
-from app.api.project.service import ProjectService
-from app.config.db import make_db
 from app.utils.job_utils import process_project_jobs
+from app.workers.deps import get_worker_db, get_worker_project_service
 
 logger = logging.getLogger(__name__)
 
-# 워커 전용 Mongo 클라이언트 (API와 분리)
-worker_db = make_db()
-project_service = ProjectService(worker_db)
-
 
 async def finalize_ingest(
     project_id: str,
@@ -27,7 +21,12 @@ async def finalize_ingest(
         thumbnail=thumbnail,
         duration_seconds=duration_seconds,
     )
-    project = await project_service.update_project(payload=update_payload)
+    project_service = get_worker_project_service()
+    # 타겟 조회는 프로젝트 업데이트 결과와 무관하므로 같은 왕복 안에 함께 수행
+    project, targets = await asyncio.gather(
+        project_service.update_project(payload=update_payload),
+        project_service.get_targets_by_project(project_id),
+    )
 
     # 공통 job 처리 로직 사용
     await process_project_jobs(
@@ -36,8 +35,9 @@ async def finalize_ingest(
         project_service=project_service,
         start_job=start_job,
         start_jobs_for_targets=start_jobs_for_targets,
-        db=worker_db,
-        context="finalize_ingest"
+        db=get_worker_db(),
+        context="finalize_ingest",
+        targets=targets,
     )
 
     # pipeline -> project_target 으로 변경 (이미 start_jobs_for_targets에서 처리됨)
@@ -1,6 +1,8 @@
-import json
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, Iterable, Tuple
 
+import msgspec
 from redis.exceptions import RedisError
 
 from app.config.redis import get_redis
@@ -13,6 +15,9 @@ UPLOAD_PROGRESS_DONE = 92
 FINALIZE_PROGRESS_START = 93
 FINALIZE_PROGRESS_DONE = 100
 
+# 진행률 틱은 최대 10Hz로 합쳐서 publish
+PROGRESS_PUBLISH_INTERVAL = 0.1
+
 
 def _progress_channel(project_id: str) -> str:
     return f"uploads:{project_id}"
@@ -20,38 +25,158 @@ def _progress_channel(project_id: str) -> str:
 
 redis_conn = get_redis()
 
+# bytes를 바로 돌려주므로 redis-py가 다시 인코딩하지 않음
+_encode = msgspec.json.encode
+
 
 def clamp(value: int, *, lower: int = 0, upper: int = 100) -> int:
     return max(lower, min(upper, value))
 
 
-def emit_progress(project_id: str, payload: Dict[str, Any]) -> None:
-    if not project_id or not redis_conn:
+def _clamp_pct(value: int) -> int:
+    # 틱마다 호출되는 경로용 0..100 고정 범위 clamp (kwargs 기본값 조회/min/max 호출 없음)
+    return 0 if value < 0 else 100 if value > 100 else value
+
+
+def _publish(items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+    items = list(items)
+    if not items:
         return
-    progress = payload.get("progress")
-    if progress is not None:
-        payload["progress"] = clamp(int(progress))
     try:
-        redis_conn.publish(_progress_channel(project_id), json.dumps(payload))
+        if len(items) == 1:
+            project_id, payload = items[0]
+            redis_conn.publish(_progress_channel(project_id), _encode(payload))
+            return
+        pipe = redis_conn.pipeline(transaction=False)
+        for project_id, payload in items:
+            pipe.publish(_progress_channel(project_id), _encode(payload))
+        pipe.execute()
     except RedisError:
         pass
 
 
-def update_job_stage(
-    job, stage: str, *, progress: int | None = None, **meta: Any
+class _PublishCoalescer:
+    """(project_id, stage)별 최신 payload만 들고 있다가 interval마다 한 번에 publish"""
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+        self._timer: threading.Timer | None = None
+        self._last_flush = 0.0
+
+    def _pop_project(
+        self, project_id: str, *, keep: Tuple[str, Any] | None = None
+    ) -> list[Tuple[str, Dict[str, Any]]]:
+        keys = [k for k in self._pending if k[0] == project_id and k != keep]
+        return [(project_id, self._pending.pop(k)) for k in keys]
+
+    def submit(self, project_id: str, payload: Dict[str, Any]) -> None:
+        key = (project_id, payload.get("stage"))
+        with self._lock:
+            # 단계가 바뀌었으면 이전 단계 틱을 먼저 보내 순서를 유지
+            _publish(self._pop_project(project_id, keep=key))
+            self._pending[key] = payload
+            if self._timer is None:
+                delay = self._last_flush + self._interval - time.monotonic()
+                self._timer = threading.Timer(max(delay, 0.0), self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush_project(self, project_id: str) -> None:
+        with self._lock:
+            _publish(self._pop_project(project_id))
+
+    def flush(self) -> None:
+        with self._lock:
+            items = [(key[0], payload) for key, payload in self._pending.items()]
+            self._pending.clear()
+            self._timer = None
+            self._last_flush = time.monotonic()
+            _publish(items)
+
+
+_coalescer = _PublishCoalescer(PROGRESS_PUBLISH_INTERVAL)
+
+
+def emit_progress(
+    project_id: str, payload: Dict[str, Any], *, coalesce: bool = False
 ) -> None:
-    if not job:
+    """진행률 이벤트 publish
+
+    coalesce=True는 잦은 중간 틱용으로 최대 10Hz로 합쳐 보내고, 단계 시작/완료 같은
+    메시지는 기본값(False)으로 즉시 보낸다.
+    """
+    if not project_id or not redis_conn:
         return
-    payload = {"stage": stage, **meta}
+    progress = payload.get("progress")
     if progress is not None:
-        payload["progress"] = clamp(int(progress))
-    job.meta.update(payload)
-    job.save_meta()
+        if not isinstance(progress, int):
+            progress = int(progress)
+        payload["progress"] = _clamp_pct(progress)
+    if coalesce:
+        _coalescer.submit(project_id, payload)
+        return
+    # 즉시 보내는 메시지보다 앞선 틱이 늦게 도착하지 않도록 먼저 비움
+    _coalescer.flush_project(project_id)
+    _publish([(project_id, payload)])
+
+
+def _meta_unchanged(job, updates: Dict[str, Any]) -> bool:
+    # job.meta는 마지막으로 저장한 상태이므로 같은 값이면 HSET을 생략할 수 있음
+    meta = job.meta
+    return all(k in meta and meta[k] == v for k, v in updates.items())
+
+
+def update_stage_and_emit(
+    job,
+    project_id: str,
+    stage: str,
+    *,
+    status: str,
+    progress: int,
+    job_progress: int | None = None,
+    force: bool = False,
+    **extra: Any,
+) -> None:
+    """job.meta 저장(save_meta와 동일한 HSET)과 진행률 publish를 한 번의 왕복으로 처리
+
+    job_progress를 주면 job.meta에는 그 값을, 이벤트에는 progress를 기록한다.
+    stage/progress가 마지막 저장과 같으면 HSET은 생략하며, force=True면 항상 저장한다.
+    """
+    progress = clamp(int(progress))
+    payload = {
+        "job_id": job.id if job else None,
+        "stage": stage,
+        "status": status,
+        **extra,
+        "progress": progress,
+    }
+    save_meta = False
+    if job:
+        meta_progress = progress if job_progress is None else clamp(int(job_progress))
+        meta_updates = {"stage": stage, **extra, "progress": meta_progress}
+        save_meta = force or not _meta_unchanged(job, meta_updates)
+        job.meta.update(meta_updates)
+
+    _coalescer.flush_project(project_id)
+    try:
+        pipe = redis_conn.pipeline(transaction=False)
+        if save_meta:
+            pipe.hset(job.key, "meta", job.serializer.dumps(job.meta))
+        if project_id:
+            pipe.publish(_progress_channel(project_id), _encode(payload))
+        pipe.execute()
+    except RedisError:
+        if save_meta:
+            raise
 
 
-def _download_part_span() -> float:
-    parts = max(DOWNLOAD_PROGRESS_PARTS, 1)
-    return (DOWNLOAD_PROGRESS_MAX - DOWNLOAD_PROGRESS_START) / parts
+# 모두 모듈 상수라 import 시 한 번만 계산 (yt_dlp 틱마다 호출되는 경로)
+_DOWNLOAD_PROGRESS_PARTS = max(DOWNLOAD_PROGRESS_PARTS, 1)
+_DOWNLOAD_PART_SPAN = (
+    DOWNLOAD_PROGRESS_MAX - DOWNLOAD_PROGRESS_START
+) / _DOWNLOAD_PROGRESS_PARTS
 
 
 def map_download_progress(
@@ -59,26 +184,60 @@ def map_download_progress(
 ) -> int | None:
     if raw_pct is None:
         return None
-    span = _download_part_span()
-    progress = DOWNLOAD_PROGRESS_START + completed_parts * span + (raw_pct / 100) * span
-    return clamp(int(progress))
+    progress = int(
+        DOWNLOAD_PROGRESS_START
+        + (completed_parts + raw_pct / 100) * _DOWNLOAD_PART_SPAN
+    )
+    return _clamp_pct(progress)
 
 
 def download_progress_for_completed_parts(completed_parts: int) -> int:
-    span = _download_part_span()
     progress = (
-        DOWNLOAD_PROGRESS_START + min(completed_parts, DOWNLOAD_PROGRESS_PARTS) * span
+        DOWNLOAD_PROGRESS_START
+        + min(completed_parts, DOWNLOAD_PROGRESS_PARTS) * _DOWNLOAD_PART_SPAN
+    )
+    return _clamp_pct(int(progress))
+
+
+def map_upload_progress(uploaded_bytes: int, total_bytes: int) -> int:
+    if total_bytes <= 0:
+        return UPLOAD_PROGRESS_DONE
+    ratio = min(uploaded_bytes / total_bytes, 1)
+    progress = UPLOAD_PROGRESS_START + ratio * (
+        UPLOAD_PROGRESS_DONE - UPLOAD_PROGRESS_START
     )
-    return clamp(int(progress))
+    return _clamp_pct(int(progress))
+
+
+def map_stream_progress(done_bytes: int, total_bytes: int) -> int:
+    # 스트리밍 모드는 다운로드와 업로드가 겹치므로 두 구간을 하나로 매핑
+    if total_bytes <= 0:
+        return UPLOAD_PROGRESS_DONE
+    ratio = min(done_bytes / total_bytes, 1)
+    progress = DOWNLOAD_PROGRESS_START + ratio * (
+        UPLOAD_PROGRESS_DONE - DOWNLOAD_PROGRESS_START
+    )
+    return _clamp_pct(int(progress))
+
+
+_PROGRESS_HOOK_STATUSES = frozenset({"downloading", "finished"})
 
 
-def make_progress_payload(status: Dict[str, Any]) -> Dict[str, Any] | None:
+def make_progress_payload(
+    status: Dict[str, Any], target: Dict[str, Any] | None = None
+) -> Dict[str, Any] | None:
+    """yt_dlp hook 상태를 payload로 변환, target을 주면 비우고 그 dict에 채운다"""
     status_name = status.get("status")
-    if status_name not in {"downloading", "finished"}:
+    if status_name not in _PROGRESS_HOOK_STATUSES:
         return None
     total = status.get("total_bytes") or status.get("total_bytes_estimate")
     downloaded = status.get("downloaded_bytes")
-    payload: Dict[str, Any] = {"status": status_name}
+    if target is None:
+        payload: Dict[str, Any] = {"status": status_name}
+    else:
+        payload = target
+        payload.clear()
+        payload["status"] = status_name
     if total and downloaded is not None:
         pct = int(downloaded / total * 100)
         payload["progress"] = clamp(pct, upper=DOWNLOAD_PROGRESS_MAX)
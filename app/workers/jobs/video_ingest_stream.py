@@ -0,0 +1,302 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Mapping
+
+import requests
+
+from app.config.s3 import s3
+
+logger = logging.getLogger(__name__)
+
+# S3 multipart 최소 파트 크기(5MB) 이상, 워커 수 x 파트 크기만큼만 메모리 사용
+STREAM_PART_SIZE = 16 * 1024 * 1024
+STREAM_MAX_WORKERS = 4
+STREAM_PART_RETRIES = 3
+STREAM_REQUEST_TIMEOUT = 30
+
+
+def can_stream_to_s3(info: Mapping[str, Any]) -> bool:
+    """임시 파일 없이 range 요청으로 바로 S3에 올릴 수 있는 포맷인지 판단
+
+    - bestvideo+bestaudio 병합(ffmpeg)이 필요한 경우는 파일 모드로 처리
+    - 썸네일이 없으면 로컬 파일에서 추출해야 하므로 파일 모드로 처리
+    """
+    return (
+        info.get("_type", "video") == "video"
+        and not info.get("requested_formats")
+        and info.get("protocol") in ("http", "https")
+        and bool(info.get("url"))
+        and bool(info.get("filesize"))
+        and bool(info.get("thumbnail"))
+    )
+
+
+def _fetch_range(
+    session: requests.Session, url: str, start: int, end: int, proxy: str | None
+) -> bytes:
+    expected = end - start + 1
+    proxies = {"http": proxy, "https": proxy} if proxy else None
+    for attempt in range(1, STREAM_PART_RETRIES + 1):
+        try:
+            response = session.get(
+                url,
+                headers={"Range": f"bytes={start}-{end}"},
+                proxies=proxies,
+                timeout=STREAM_REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            body = response.content
+            if len(body) == expected:
+                return body
+            logger.warning(
+                "range %s-%s returned %s bytes (expected %s)",
+                start,
+                end,
+                len(body),
+                expected,
+            )
+        except requests.RequestException as exc:
+            if attempt == STREAM_PART_RETRIES:
+                raise
+            logger.warning(
+                "range %s-%s failed (attempt %s): %s", start, end, attempt, exc
+            )
+    raise IOError(f"incomplete range response for bytes={start}-{end}")
+
+
+def stream_to_s3(
+    info: Mapping[str, Any],
+    *,
+    bucket: str,
+    object_key: str,
+    proxy: str | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+) -> None:
+    """yt_dlp가 고른 단일 포맷을 파트 단위 range GET -> upload_part로 병렬 전송
+
+    로컬 디스크에 쓰지 않고, 다운로드와 업로드가 파트별로 겹쳐 진행된다.
+    실패 시 multipart 업로드를 abort 한다.
+    """
+    url = info["url"]
+    total_bytes = int(info["filesize"])
+    # yt_dlp가 포맷별로 정한 요청당 최대 크기(유튜브 https는 10MiB)를 넘지 않도록 쪼개서 요청
+    chunk_size = (info.get("downloader_options") or {}).get("http_chunk_size")
+    request_size = STREAM_PART_SIZE
+    if chunk_size:
+        request_size = min(int(chunk_size), STREAM_PART_SIZE)
+    ranges = [
+        (start, min(start + STREAM_PART_SIZE, total_bytes) - 1)
+        for start in range(0, total_bytes, STREAM_PART_SIZE)
+    ]
+
+    session = requests.Session()
+    session.headers.update(info.get("http_headers") or {})
+
+    upload_id = s3.create_multipart_upload(Bucket=bucket, Key=object_key)["UploadId"]
+
+    def _transfer_part(part_number: int, start: int, end: int) -> dict[str, Any]:
+        body = b"".join(
+            _fetch_range(
+                session, url, offset, min(offset + request_size, end + 1) - 1, proxy
+            )
+            for offset in range(start, end + 1, request_size)
+        )
+        result = s3.upload_part(
+            Bucket=bucket,
+            Key=object_key,
+            PartNumber=part_number,
+            UploadId=upload_id,
+            Body=body,
+        )
+        return {"PartNumber": part_number, "ETag": result["ETag"]}
+
+    executor = ThreadPoolExecutor(max_workers=STREAM_MAX_WORKERS)
+    try:
+        futures = [
+            (executor.submit(_transfer_part, number, start, end), end - start + 1)
+            for number, (start, end) in enumerate(ranges, start=1)
+        ]
+        parts = []
+        done_bytes = 0
+        for future, size in futures:
+            parts.append(future.result())
+            done_bytes += size
+            if progress_callback:
+                progress_callback(done_bytes, total_bytes)
+
+        s3.complete_multipart_upload(
+            Bucket=bucket,
+            Key=object_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except BaseException:
+        # 진행 중인 파트가 끝난 뒤 abort 해야 고아 파트가 남지 않음
+        executor.shutdown(wait=True, cancel_futures=True)
+        try:
+            s3.abort_multipart_upload(
+                Bucket=bucket, Key=object_key, UploadId=upload_id
+            )
+        except Exception:
+            logger.exception("failed to abort multipart upload %s", upload_id)
+        raise
+    finally:
+        executor.shutdown(wait=True)
+        session.close()
+
+
+class TailMultipartUploader:
+    """yt_dlp가 순차적으로 쓰는 .part 파일을 다운로드 도중 파트 단위로 업로드
+
+    yt_dlp progress hook(on_progress)으로 시작하고, 다운로드가 끝나면 finish()로
+    남은 꼬리 바이트를 올려 완료한다. 후처리(ffmpeg fixup 등)로 파일이 바뀌었으면
+    multipart 업로드를 abort 하고 False를 돌려주므로 호출 측은 일반 업로드로 대체한다.
+    """
+
+    POLL_INTERVAL = 0.5
+
+    def __init__(
+        self,
+        *,
+        bucket: str,
+        object_key_for: Callable[[str], str],
+        part_size: int = STREAM_PART_SIZE,
+    ) -> None:
+        self._bucket = bucket
+        self._object_key_for = object_key_for
+        self._part_size = part_size
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._fd: int | None = None
+        self._upload_id: str | None = None
+        self._error: BaseException | None = None
+        self._parts: list[dict[str, Any]] = []
+        self._offset = 0
+        self.object_key: str | None = None
+
+    @property
+    def started(self) -> bool:
+        return self._upload_id is not None
+
+    def on_progress(self, status: Mapping[str, Any]) -> None:
+        if self._upload_id or self._done.is_set():
+            return
+        if status.get("status") != "downloading":
+            return
+        tmp_path = status.get("tmpfilename")
+        filename = status.get("filename")
+        if not tmp_path or not filename or not os.path.exists(tmp_path):
+            return
+        with self._lock:
+            if self._upload_id or self._done.is_set():
+                return
+            try:
+                self._fd = os.open(tmp_path, os.O_RDONLY)
+                self.object_key = self._object_key_for(filename)
+                self._upload_id = s3.create_multipart_upload(
+                    Bucket=self._bucket, Key=self.object_key
+                )["UploadId"]
+            except Exception:
+                # 꼬리 업로드는 최적화일 뿐이므로 실패하면 일반 업로드로 진행
+                logger.exception("failed to start tail upload for %s", tmp_path)
+                self._close_fd()
+                self._done.set()
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="ingest-tail-upload", daemon=True
+            )
+            self._thread.start()
+
+    def _upload_part(self, body: bytes) -> None:
+        part_number = len(self._parts) + 1
+        result = s3.upload_part(
+            Bucket=self._bucket,
+            Key=self.object_key,
+            PartNumber=part_number,
+            UploadId=self._upload_id,
+            Body=body,
+        )
+        self._parts.append({"PartNumber": part_number, "ETag": result["ETag"]})
+        self._offset += len(body)
+
+    def _upload_full_parts(self, stop: threading.Event | None = None) -> None:
+        while os.fstat(self._fd).st_size - self._offset >= self._part_size:
+            # abort 시 파트 하나 이상 기다리지 않도록 파트마다 중단 여부 확인
+            if stop is not None and stop.is_set():
+                return
+            self._upload_part(os.pread(self._fd, self._part_size, self._offset))
+
+    def _run(self) -> None:
+        try:
+            while not self._done.is_set():
+                self._upload_full_parts(self._done)
+                self._done.wait(self.POLL_INTERVAL)
+        except BaseException as exc:
+            self._error = exc
+
+    def finish(self, final_path: str) -> bool:
+        """남은 바이트를 올리고 완료. 업로드한 내용이 final_path와 같을 때만 True"""
+        self._done.set()
+        if self._thread:
+            self._thread.join()
+        if not self.started:
+            return False
+        try:
+            if self._error is not None:
+                raise self._error
+            # .part -> 최종 파일 rename은 같은 inode, 후처리로 교체됐다면 inode/크기가 다름
+            final_stat = os.stat(final_path)
+            tail_stat = os.fstat(self._fd)
+            if (final_stat.st_dev, final_stat.st_ino, final_stat.st_size) != (
+                tail_stat.st_dev,
+                tail_stat.st_ino,
+                tail_stat.st_size,
+            ):
+                raise IOError(f"{final_path} changed after download")
+            self._upload_full_parts()
+            if self._offset < final_stat.st_size or not self._parts:
+                self._upload_part(
+                    os.pread(self._fd, final_stat.st_size - self._offset, self._offset)
+                )
+            s3.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self.object_key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+            return True
+        except Exception:
+            logger.warning(
+                "tail upload for %s discarded, falling back", final_path, exc_info=True
+            )
+            self._abort_upload()
+            return False
+        finally:
+            self._close_fd()
+
+    def abort(self) -> None:
+        self._done.set()
+        # on_progress가 락을 잡은 채 업로드를 시작하는 중일 수 있으므로 끝날 때까지 대기
+        with self._lock:
+            if self._thread:
+                self._thread.join()
+            if self.started:
+                self._abort_upload()
+            self._close_fd()
+
+    def _abort_upload(self) -> None:
+        try:
+            s3.abort_multipart_upload(
+                Bucket=self._bucket, Key=self.object_key, UploadId=self._upload_id
+            )
+        except Exception:
+            logger.exception("failed to abort multipart upload %s", self._upload_id)
+        self._upload_id = None
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
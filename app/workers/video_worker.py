@@ -1,13 +1,82 @@
 # app/worker/worker.py
-from rq import Worker, Queue
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from rq import Queue, SimpleWorker
+from app.config.env import settings
 from app.config.redis import get_redis
+from app.workers.deps import close_worker_db
+from app.workers.event_loop import get_worker_loop
+
+logger = logging.getLogger(__name__)
+
+
+def _last_modified(path: Path) -> float:
+    # 긴 다운로드는 기존 .part 파일에만 쓰므로 디렉터리 mtime만으로는 부족함
+    latest = path.stat().st_mtime
+    for child in path.iterdir():
+        try:
+            latest = max(latest, child.stat().st_mtime)
+        except OSError:
+            continue
+    return latest
+
+
+def sweep_ingest_tmpdirs(ttl_seconds: int | None = None) -> int:
+    """크래시/kill -9로 남은 ingest 임시 디렉터리(tmp*) 중 TTL이 지난 것을 삭제"""
+    ttl = settings.INGEST_TMP_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    cutoff = time.time() - ttl
+    removed = 0
+    for root in {settings.INGEST_WORKDIR, settings.INGEST_TMPFS_DIR}:
+        if not root:
+            continue
+        root_path = Path(root)
+        if not root_path.is_dir():
+            continue
+        for path in root_path.glob("tmp*"):
+            try:
+                if not path.is_dir() or _last_modified(path) > cutoff:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+    if removed:
+        logger.info("removed %s stale ingest temp dirs", removed)
+    return removed
+
+
+def _start_sweeper(interval_seconds: int) -> None:
+    # 임시 파일은 이 호스트의 로컬 디스크에 있으므로 RQ 잡이 아닌 워커 내부 스레드로 실행
+    def _loop() -> None:
+        while True:
+            time.sleep(interval_seconds)
+            try:
+                sweep_ingest_tmpdirs()
+            except Exception:
+                logger.exception("ingest temp sweep failed")
+
+    threading.Thread(target=_loop, name="ingest-tmp-sweeper", daemon=True).start()
 
 
 def main():
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
     listen = ["uploads"]  # 큐 이름
     connection = get_redis()
     queues = [Queue(name, connection=connection) for name in listen]
-    Worker(queues, connection=connection).work(with_scheduler=True)
+    sweep_ingest_tmpdirs()
+    _start_sweeper(settings.INGEST_SWEEP_INTERVAL_SECONDS)
+    # 잡마다 fork 하면 루프와 커넥션 풀이 매번 버려지므로 같은 프로세스에서 실행
+    get_worker_loop()
+    try:
+        SimpleWorker(queues, connection=connection).work(with_scheduler=True)
+    finally:
+        # SIGTERM은 RQ가 warm shutdown으로 처리하고 work()가 반환되면 풀을 정리
+        close_worker_db()
 
 
 if __name__ == "__main__":
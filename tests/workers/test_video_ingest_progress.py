@@ -0,0 +1,177 @@
+"""
+진행률 publish 코얼레서 테스트 (Redis 없이 가짜 연결로 검증)
+
+실행: pytest tests/workers/test_video_ingest_progress.py -v
+"""
+
+import json
+import time
+
+import pytest
+
+from app.workers.jobs import video_ingest_progress as progress
+
+
+class FakeRedis:
+    """publish/pipeline 호출을 순서대로 기록"""
+
+    def __init__(self):
+        self.published = []
+        self.meta_writes = []
+
+    def publish(self, channel, data):
+        self.published.append((channel, json.loads(data)))
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hset(self, key, field, value):
+        self.commands.append(("hset", (key, field, value)))
+
+    def publish(self, channel, data):
+        self.commands.append(("publish", (channel, data)))
+
+    def execute(self):
+        for command, args in self.commands:
+            if command == "hset":
+                self.redis.meta_writes.append(args)
+            else:
+                self.redis.publish(*args)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(progress, "redis_conn", redis)
+    # 타이머가 테스트 도중 끼어들지 않도록 간격을 길게 잡고 flush는 직접 호출
+    monkeypatch.setattr(progress, "_coalescer", progress._PublishCoalescer(60))
+    return redis
+
+
+def _tick(stage, value, status="downloading"):
+    return {"job_id": "job", "stage": stage, "status": status, "progress": value}
+
+
+def test_coalesced_ticks_publish_only_latest(fake_redis):
+    """같은 단계의 틱은 flush 시 마지막 값 하나만 전송"""
+    for value in range(10, 20):
+        progress.emit_progress("p1", _tick("downloading", value), coalesce=True)
+    assert fake_redis.published == []
+
+    progress._coalescer.flush()
+
+    assert fake_redis.published == [("uploads:p1", _tick("downloading", 19))]
+
+
+def test_immediate_message_flushes_pending_ticks_first(fake_redis):
+    """즉시 전송 메시지보다 앞선 틱이 먼저 도착해야 함"""
+    progress.emit_progress("p1", _tick("downloading", 30), coalesce=True)
+    progress.emit_progress("p1", _tick("uploading", 71, status="업로드 시작"))
+
+    assert [payload["progress"] for _, payload in fake_redis.published] == [30, 71]
+
+    # 이미 보낸 틱은 다음 flush에서 다시 나가지 않음
+    progress._coalescer.flush()
+    assert len(fake_redis.published) == 2
+
+
+def test_stage_change_flushes_previous_stage(fake_redis):
+    """단계가 바뀌면 이전 단계의 대기 중인 틱을 먼저 전송"""
+    progress.emit_progress("p1", _tick("downloading", 40), coalesce=True)
+    progress.emit_progress("p1", _tick("uploading", 75, "업로드 중"), coalesce=True)
+
+    assert fake_redis.published == [("uploads:p1", _tick("downloading", 40))]
+
+    progress._coalescer.flush()
+    assert fake_redis.published[-1] == (
+        "uploads:p1",
+        _tick("uploading", 75, "업로드 중"),
+    )
+
+
+def test_other_projects_are_not_flushed(fake_redis):
+    """즉시 전송은 해당 프로젝트의 대기 틱만 비움"""
+    progress.emit_progress("p1", _tick("downloading", 10), coalesce=True)
+    progress.emit_progress("p2", _tick("done", 100, status="최종 처리 완료"))
+
+    assert fake_redis.published == [
+        ("uploads:p2", _tick("done", 100, status="최종 처리 완료"))
+    ]
+
+
+def test_timer_flushes_after_interval(monkeypatch):
+    """flush를 호출하지 않아도 interval 뒤 타이머가 전송"""
+    redis = FakeRedis()
+    monkeypatch.setattr(progress, "redis_conn", redis)
+    monkeypatch.setattr(progress, "_coalescer", progress._PublishCoalescer(0.05))
+
+    progress.emit_progress("p1", _tick("downloading", 50), coalesce=True)
+
+    deadline = time.monotonic() + 2
+    while not redis.published and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert redis.published == [("uploads:p1", _tick("downloading", 50))]
+
+
+def test_progress_is_clamped(fake_redis):
+    progress.emit_progress("p1", _tick("downloading", 130.7))
+
+    assert fake_redis.published[0][1]["progress"] == 100
+
+
+class FakeJob:
+    """rq Job 중 update_stage_and_emit이 쓰는 속성만 흉내냄"""
+
+    id = "job"
+    key = "rq:job:job"
+
+    class serializer:
+        dumps = staticmethod(json.dumps)
+
+    def __init__(self):
+        self.meta = {}
+
+
+def test_stage_update_writes_meta_and_publishes(fake_redis):
+    job = FakeJob()
+
+    progress.update_stage_and_emit(
+        job, "p1", "downloading", status="다운로드 시작", progress=5, job_progress=0
+    )
+
+    assert job.meta == {"stage": "downloading", "progress": 0}
+    assert fake_redis.meta_writes == [
+        ("rq:job:job", "meta", json.dumps({"stage": "downloading", "progress": 0}))
+    ]
+    assert fake_redis.published == [
+        (
+            "uploads:p1",
+            {
+                "job_id": "job",
+                "stage": "downloading",
+                "status": "다운로드 시작",
+                "progress": 5,
+            },
+        )
+    ]
+
+
+def test_unchanged_stage_skips_meta_write_unless_forced(fake_redis):
+    """stage/progress가 같으면 HSET 생략, force=True면 항상 저장 (publish는 매번)"""
+    job = FakeJob()
+
+    progress.update_stage_and_emit(job, "p1", "uploading", status="a", progress=71)
+    progress.update_stage_and_emit(job, "p1", "uploading", status="a", progress=71)
+    assert len(fake_redis.meta_writes) == 1
+
+    progress.update_stage_and_emit(
+        job, "p1", "uploading", status="a", progress=71, force=True
+    )
+    assert len(fake_redis.meta_writes) == 2
+    assert len(fake_redis.published) == 3
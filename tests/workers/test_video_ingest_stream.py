@@ -0,0 +1,387 @@
+"""
+S3 스트리밍 업로드(stream_to_s3)와 다운로드 중 꼬리 업로드(TailMultipartUploader) 테스트
+(S3/유튜브 없이 가짜 클라이언트로 검증)
+
+실행: pytest tests/workers/test_video_ingest_stream.py -v
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+import requests
+
+from app.workers.jobs import video_ingest as ingest
+from app.workers.jobs import video_ingest_stream as stream
+
+PART_SIZE = 1000
+
+
+class FakeS3:
+    """multipart 업로드 호출을 기록"""
+
+    def __init__(self):
+        self.parts = {}
+        self.completed = None
+        self.aborted = False
+
+    def create_multipart_upload(self, Bucket, Key):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, Bucket, Key, PartNumber, UploadId, Body):
+        self.parts[PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+    def uploaded_bytes(self):
+        return b"".join(self.parts[number] for number in self.completed)
+
+
+class FakeResponse:
+    def __init__(self, content, status_code=206):
+        self.content = content
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"status {self.status_code}")
+
+
+class FakeSession:
+    """Range 헤더대로 data를 잘라 돌려주는 requests.Session 대용"""
+
+    data = b""
+    short_ranges = set()
+    ranges = []
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.headers = {}
+
+    def get(self, url, headers, proxies=None, timeout=None):
+        start, end = (int(v) for v in headers["Range"][len("bytes="):].split("-"))
+        with self.lock:
+            self.ranges.append((start, end))
+        # 앞 파트일수록 늦게 끝나도록 해 완료 순서가 뒤섞이게 함
+        time.sleep(max(0.0, 0.02 - start / 100000))
+        body = self.data[start : end + 1]
+        if start in self.short_ranges:
+            body = body[:-1]
+        return FakeResponse(body)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    FakeSession.data = os.urandom(3500)
+    FakeSession.short_ranges = set()
+    FakeSession.ranges = []
+    monkeypatch.setattr(stream.requests, "Session", FakeSession)
+    monkeypatch.setattr(stream, "STREAM_PART_SIZE", PART_SIZE)
+    return FakeSession
+
+
+def _stream_info(**overrides):
+    info = {
+        "_type": "video",
+        "protocol": "https",
+        "url": "https://example.com/video.mp4",
+        "filesize": 3500,
+        "thumbnail": "https://example.com/thumb.jpg",
+    }
+    info.update(overrides)
+    return info
+
+
+@pytest.mark.parametrize(
+    "overrides, expected",
+    [
+        ({}, True),
+        ({"requested_formats": [{"format_id": "137"}, {"format_id": "140"}]}, False),
+        ({"protocol": "m3u8_native"}, False),
+        ({"filesize": None}, False),
+        ({"thumbnail": None}, False),
+        ({"url": None}, False),
+        ({"_type": "playlist"}, False),
+    ],
+)
+def test_can_stream_to_s3(overrides, expected):
+    assert stream.can_stream_to_s3(_stream_info(**overrides)) is expected
+
+
+def test_stream_to_s3_completes_parts_in_order(fake_s3, fake_session):
+    """파트가 뒤섞인 순서로 끝나도 PartNumber 순서대로 완료하고 진행률은 누적"""
+    progress = []
+
+    stream.stream_to_s3(
+        _stream_info(),
+        bucket="bucket",
+        object_key="key",
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+
+    assert fake_s3.completed == [1, 2, 3, 4]
+    assert fake_s3.uploaded_bytes() == fake_session.data
+    assert progress == [(1000, 3500), (2000, 3500), (3000, 3500), (3500, 3500)]
+    assert fake_s3.aborted is False
+
+
+def test_stream_to_s3_caps_requests_at_http_chunk_size(fake_s3, fake_session):
+    """yt_dlp의 http_chunk_size보다 큰 range는 여러 요청으로 나눠 한 파트를 채움"""
+    stream.stream_to_s3(
+        _stream_info(downloader_options={"http_chunk_size": 400}),
+        bucket="bucket",
+        object_key="key",
+    )
+
+    assert max(end - start + 1 for start, end in fake_session.ranges) <= 400
+    assert fake_s3.completed == [1, 2, 3, 4]
+    assert fake_s3.uploaded_bytes() == fake_session.data
+
+
+def test_stream_to_s3_aborts_on_short_range(fake_s3, fake_session):
+    """재시도 후에도 응답이 짧으면 multipart 업로드를 abort"""
+    fake_session.short_ranges = {2000}
+
+    with pytest.raises(IOError):
+        stream.stream_to_s3(_stream_info(), bucket="bucket", object_key="key")
+
+    assert fake_s3.aborted is True
+    assert fake_s3.completed is None
+
+
+def test_stream_to_s3_aborts_when_progress_callback_raises(fake_s3, fake_session):
+    """진행률 콜백의 예외(잡 취소 등)도 abort 후 그대로 전파"""
+
+    def _cancel(done, total):
+        raise ingest.IngestCancelled("cancelled")
+
+    with pytest.raises(ingest.IngestCancelled):
+        stream.stream_to_s3(
+            _stream_info(), bucket="bucket", object_key="key", progress_callback=_cancel
+        )
+
+    assert fake_s3.aborted is True
+    assert fake_s3.completed is None
+
+
+class FakeYoutubeDL:
+    """extract_info -> (스트리밍 | process_ie_result) 흐름만 흉내냄"""
+
+    downloaded = False
+
+    def __init__(self, opts):
+        self.opts = opts
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def extract_info(self, url, download=False):
+        return _stream_info(id="abc", ext="mp4")
+
+    def prepare_filename(self, info):
+        return os.path.join(os.path.dirname(self.opts["outtmpl"]), "abc.mp4")
+
+    def add_progress_hook(self, hook):
+        pass
+
+    def process_ie_result(self, info, download=True):
+        FakeYoutubeDL.downloaded = True
+        return info
+
+
+@pytest.fixture
+def fake_youtube_dl(monkeypatch):
+    FakeYoutubeDL.downloaded = False
+    monkeypatch.setattr(ingest, "YoutubeDL", FakeYoutubeDL)
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    return FakeYoutubeDL
+
+
+def test_download_falls_back_to_file_when_streaming_fails(fake_youtube_dl, tmp_path):
+    """스트리밍이 실패하면 잡을 실패시키지 않고 파일 다운로드로 진행"""
+
+    def _stream_upload(info, filename):
+        raise requests.HTTPError("403 Forbidden")
+
+    filename, _, streamed = asyncio.run(
+        ingest._download_youtube_video(
+            "https://youtu.be/abc", str(tmp_path), stream_upload=_stream_upload
+        )
+    )
+
+    assert streamed is False
+    assert fake_youtube_dl.downloaded is True
+    assert filename == str(tmp_path / "abc.mp4")
+
+
+def test_download_does_not_fall_back_when_cancelled(fake_youtube_dl, tmp_path):
+    def _stream_upload(info, filename):
+        raise ingest.IngestCancelled("cancelled")
+
+    with pytest.raises(ingest.IngestCancelled):
+        asyncio.run(
+            ingest._download_youtube_video(
+                "https://youtu.be/abc", str(tmp_path), stream_upload=_stream_upload
+            )
+        )
+
+    assert fake_youtube_dl.downloaded is False
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    s3 = FakeS3()
+    monkeypatch.setattr(stream, "s3", s3)
+    monkeypatch.setattr(stream.TailMultipartUploader, "POLL_INTERVAL", 0.01)
+    return s3
+
+
+def _make_uploader():
+    return stream.TailMultipartUploader(
+        bucket="bucket",
+        object_key_for=lambda name: f"projects/p/{os.path.basename(name)}",
+        part_size=PART_SIZE,
+    )
+
+
+def _wait_for_parts(s3, count):
+    deadline = time.monotonic() + 2
+    while len(s3.parts) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _start_download(uploader, tmp_path, first_chunk):
+    """yt_dlp처럼 .part 파일에 쓰기 시작하고 downloading 훅을 호출"""
+    part_path = tmp_path / "video.mp4.part"
+    final_path = tmp_path / "video.mp4"
+    handle = open(part_path, "wb")
+    handle.write(first_chunk)
+    handle.flush()
+    uploader.on_progress(
+        {
+            "status": "downloading",
+            "tmpfilename": str(part_path),
+            "filename": str(final_path),
+        }
+    )
+    return handle, part_path, final_path
+
+
+def test_finish_uploads_parts_during_download_and_tail(fake_s3, tmp_path):
+    """완성된 파트는 다운로드 중에 올리고, finish에서 꼬리를 올려 완료"""
+    data = os.urandom(3500)
+    uploader = _make_uploader()
+    handle, part_path, final_path = _start_download(uploader, tmp_path, data[:100])
+
+    handle.write(data[100:2500])
+    handle.flush()
+    _wait_for_parts(fake_s3, 2)
+    assert sorted(fake_s3.parts) == [1, 2]
+
+    handle.write(data[2500:])
+    handle.close()
+    os.rename(part_path, final_path)
+
+    assert uploader.finish(str(final_path)) is True
+    assert fake_s3.completed == [1, 2, 3, 4]
+    assert fake_s3.uploaded_bytes() == data
+    assert uploader.object_key == "projects/p/video.mp4"
+    assert fake_s3.aborted is False
+
+
+def test_finish_falls_back_when_file_replaced(fake_s3, tmp_path):
+    """후처리로 파일이 교체되면(inode 변경) abort 후 False"""
+    uploader = _make_uploader()
+    handle, part_path, final_path = _start_download(uploader, tmp_path, b"a" * 1500)
+    handle.close()
+
+    # ffmpeg fixup처럼 새 파일을 만들어 최종 경로를 덮어씀
+    fixed_path = tmp_path / "video.fixed.mp4"
+    fixed_path.write_bytes(b"b" * 1500)
+    os.replace(fixed_path, final_path)
+    part_path.unlink()
+
+    assert uploader.finish(str(final_path)) is False
+    assert fake_s3.aborted is True
+    assert fake_s3.completed is None
+
+
+def test_finish_falls_back_when_part_upload_failed(fake_s3, tmp_path, monkeypatch):
+    """백그라운드 파트 업로드가 실패하면 abort 후 False"""
+
+    def _fail(**kwargs):
+        raise IOError("network down")
+
+    monkeypatch.setattr(fake_s3, "upload_part", _fail)
+    uploader = _make_uploader()
+    handle, part_path, final_path = _start_download(uploader, tmp_path, b"a" * 2500)
+    handle.close()
+    os.rename(part_path, final_path)
+
+    assert uploader.finish(str(final_path)) is False
+    assert fake_s3.aborted is True
+
+
+def test_abort_cancels_started_upload(fake_s3, tmp_path):
+    uploader = _make_uploader()
+    handle, _, _ = _start_download(uploader, tmp_path, b"a" * 10)
+    handle.close()
+
+    uploader.abort()
+
+    assert fake_s3.aborted is True
+    assert uploader.started is False
+
+
+def test_abort_waits_for_upload_being_started(fake_s3, tmp_path, monkeypatch):
+    """on_progress가 업로드를 만드는 도중 abort해도 업로드가 남지 않음"""
+    creating = threading.Event()
+    release = threading.Event()
+    create = fake_s3.create_multipart_upload
+
+    def _slow_create(**kwargs):
+        creating.set()
+        release.wait(2)
+        return create(**kwargs)
+
+    monkeypatch.setattr(fake_s3, "create_multipart_upload", _slow_create)
+    uploader = _make_uploader()
+    starter = threading.Thread(
+        target=_start_download, args=(uploader, tmp_path, b"a" * 10)
+    )
+    starter.start()
+    assert creating.wait(2)
+
+    aborter = threading.Thread(target=uploader.abort)
+    aborter.start()
+    time.sleep(0.05)
+    release.set()
+    starter.join(2)
+    aborter.join(2)
+
+    assert not aborter.is_alive()
+    assert fake_s3.aborted is True
+    assert uploader.started is False
+
+
+def test_finish_without_download_hook_returns_false(fake_s3, tmp_path):
+    """훅이 한 번도 불리지 않았으면 업로드를 시작하지 않고 일반 업로드로 넘김"""
+    final_path = tmp_path / "video.mp4"
+    final_path.write_bytes(b"a" * 10)
+
+    assert _make_uploader().finish(str(final_path)) is False
+    assert fake_s3.parts == {}
+    assert fake_s3.aborted is False